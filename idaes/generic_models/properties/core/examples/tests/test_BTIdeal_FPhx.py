@@ -13,6 +13,8 @@
 """
 Author: Andrew Lee
 """
+from functools import lru_cache
+
 import pytest
 from pyomo.environ import (ConcreteModel,
                            Set,
@@ -23,6 +25,7 @@ from pyomo.environ import (ConcreteModel,
                            units as pyunits)
 from pyomo.util.check_units import assert_units_consistent
 from pyomo.common.unittest import assertStructuredAlmostEqual
+from pyomo.common.collections import ComponentMap
 
 from idaes.core import Component
 from idaes.core.util.model_statistics import (degrees_of_freedom,
@@ -48,13 +51,28 @@ import idaes.generic_models.properties.core.pure.RPP4 as RPP4
 
 # -----------------------------------------------------------------------------
 # Get default solver for testing
-solver = get_solver()
+@pytest.fixture(scope="session")
+def solver():
+    # Resolved lazily so that runs which only select unit tests never need to
+    # look up a solver
+    solver = get_solver()
+    if not solver.available(exception_flag=False):
+        pytest.skip("Solver not available")
+    return solver
+
+
+# Memoized on the string form of the Pyomo units, as the same few units are
+# converted many times when comparing state bounds
+@lru_cache(maxsize=None)
+def _unit_to_pint(unit_str):
+    return pyunits._pint_registry.parse_expression(unit_str)
+
 
 def _as_quantity(x):
     unit = pyunits.get_units(x)
     if unit is None:
         unit = pyunits.dimensionless
-    return value(x) * unit._get_pint_unit()
+    return value(x) * _unit_to_pint(str(unit))
 
 config_dict = {
     "components": {
@@ -139,31 +157,59 @@ config_dict = {
     "bubble_dew_method": IdealBubbleDew}
 
 
+@pytest.fixture(scope="module")
+def params_model():
+    # Building the parameter block is the most expensive step in this module,
+    # so build it once. TestParamBlock uses this model as is; the state block
+    # tests add their state block to a clone of it
+    model = ConcreteModel()
+    model.params = GenericParameterBlock(default=config_dict)
+
+    return model
+
+
+@pytest.fixture(scope="module")
+def model(params_model):
+    # Clone, so that adding, scaling and solving the state block leaves the
+    # model seen by TestParamBlock untouched
+    model = params_model.clone()
+
+    model.props = model.params.state_block_class(
+            [1],
+            default={"parameters": model.params,
+                     "defined_state": True})
+
+    model.props[1].calculate_scaling_factors()
+
+    # Fix state
+    model.props[1].flow_mol.fix(1)
+    model.props[1].enth_mol.fix(47297)
+    model.props[1].pressure.fix(101325)
+    model.props[1].mole_frac_comp["benzene"].fix(0.5)
+    model.props[1].mole_frac_comp["toluene"].fix(0.5)
+
+    return model
+
+
 class TestParamBlock(object):
     @pytest.mark.unit
-    def test_build(self):
-        model = ConcreteModel()
-        model.params = GenericParameterBlock(default=config_dict)
+    def test_build(self, params_model):
+        model = params_model
 
         assert isinstance(model.params.phase_list, Set)
-        assert len(model.params.phase_list) == 2
-        for i in model.params.phase_list:
-            assert i in ["Liq", "Vap"]
+        assert set(model.params.phase_list) == {"Liq", "Vap"}
         assert model.params.Liq.is_liquid_phase()
         assert model.params.Vap.is_vapor_phase()
 
         assert isinstance(model.params.component_list, Set)
-        assert len(model.params.component_list) == 2
+        assert set(model.params.component_list) == {"benzene", "toluene"}
         for i in model.params.component_list:
-            assert i in ['benzene',
-                         'toluene']
             assert isinstance(model.params.get_component(i), Component)
 
         assert isinstance(model.params._phase_component_set, Set)
-        assert len(model.params._phase_component_set) == 4
-        for i in model.params._phase_component_set:
-            assert i in [("Liq", "benzene"), ("Liq", "toluene"),
-                         ("Vap", "benzene"), ("Vap", "toluene")]
+        assert set(model.params._phase_component_set) == {
+            ("Liq", "benzene"), ("Liq", "toluene"),
+            ("Vap", "benzene"), ("Vap", "toluene")}
 
         assert model.params.config.state_definition == FPhx
 
@@ -180,9 +226,7 @@ class TestParamBlock(object):
             ("Vap", "Liq"): SmoothVLE}
 
         assert isinstance(model.params.phase_equilibrium_idx, Set)
-        assert len(model.params.phase_equilibrium_idx) == 2
-        for i in model.params.phase_equilibrium_idx:
-            assert i in ["PE1", "PE2"]
+        assert set(model.params.phase_equilibrium_idx) == {"PE1", "PE2"}
 
         assert model.params.phase_equilibrium_list == {
             "PE1": {"benzene": ("Vap", "Liq")},
@@ -191,31 +235,8 @@ class TestParamBlock(object):
         assert model.params.pressure_ref.value == 1e5
         assert model.params.temperature_ref.value == 300
 
-        assert_units_consistent(model)
-
 
 class TestStateBlock(object):
-    @pytest.fixture(scope="class")
-    def model(self):
-        model = ConcreteModel()
-        model.params = GenericParameterBlock(default=config_dict)
-
-        model.props = model.params.state_block_class(
-                [1],
-                default={"parameters": model.params,
-                         "defined_state": True})
-
-        model.props[1].calculate_scaling_factors()
-
-        # Fix state
-        model.props[1].flow_mol.fix(1)
-        model.props[1].enth_mol.fix(47297)
-        model.props[1].pressure.fix(101325)
-        model.props[1].mole_frac_comp["benzene"].fix(0.5)
-        model.props[1].mole_frac_comp["toluene"].fix(0.5)
-
-        return model
-
     @pytest.mark.unit
     def test_build(self, model):
         # Check state variable values and bounds
@@ -241,109 +262,76 @@ class TestStateBlock(object):
 
         assert isinstance(model.props[1].mole_frac_comp, Var)
         assert len(model.props[1].mole_frac_comp) == 2
-        for i in model.props[1].mole_frac_comp:
-            assert value(model.props[1].mole_frac_comp[i]) == 0.5
+        for v in model.props[1].mole_frac_comp.values():
+            assert v.value == 0.5
 
+    @pytest.mark.unit
+    def test_units_consistent(self, model):
+        # Covers the parameter block as well, as the model holds a copy of it
         assert_units_consistent(model)
 
     @pytest.mark.unit
     def test_basic_scaling(self, model):
-        assert len(model.props[1].scaling_factor) == 26
-
-        assert model.props[1].scaling_factor[
-            model.props[1]._mole_frac_tbub["Vap", "Liq", "benzene"]] == 1000
-        assert model.props[1].scaling_factor[
-            model.props[1]._mole_frac_tbub["Vap", "Liq", "toluene"]] == 1000
-        assert model.props[1].scaling_factor[
-            model.props[1]._mole_frac_tdew["Vap", "Liq", "benzene"]] == 1000
-        assert model.props[1].scaling_factor[
-            model.props[1]._mole_frac_tdew["Vap", "Liq", "toluene"]] == 1000
-        assert model.props[1].scaling_factor[
-            model.props[1]._t1_Vap_Liq] == 1e-2
-        assert model.props[1].scaling_factor[
-            model.props[1]._teq["Vap", "Liq"]] == 1e-2
-        assert model.props[1].scaling_factor[
-            model.props[1].dens_mol_phase["Liq"]] == 1e-2
-        assert model.props[1].scaling_factor[
-            model.props[1].dens_mol_phase["Vap"]] == 1e-2
-        assert model.props[1].scaling_factor[model.props[1].enth_mol] == 1e-4
-        assert model.props[1].scaling_factor[model.props[1].flow_mol] == 1e-2
-        assert model.props[1].scaling_factor[
-            model.props[1].flow_mol_phase["Liq"]] == 1e-2
-        assert model.props[1].scaling_factor[
-            model.props[1].flow_mol_phase["Vap"]] == 1e-2
-        assert model.props[1].scaling_factor[
-            model.props[1].flow_mol_phase_comp["Liq", "benzene"]] == 1e-2
-        assert model.props[1].scaling_factor[
-            model.props[1].flow_mol_phase_comp["Liq", "toluene"]] == 1e-2
-        assert model.props[1].scaling_factor[
-            model.props[1].flow_mol_phase_comp["Vap", "benzene"]] == 1e-2
-        assert model.props[1].scaling_factor[
-            model.props[1].flow_mol_phase_comp["Vap", "toluene"]] == 1e-2
-        assert model.props[1].scaling_factor[
-            model.props[1].mole_frac_comp["benzene"]] == 1000
-        assert model.props[1].scaling_factor[
-            model.props[1].mole_frac_comp["toluene"]] == 1000
-        assert model.props[1].scaling_factor[
-            model.props[1].mole_frac_phase_comp["Liq", "benzene"]] == 1000
-        assert model.props[1].scaling_factor[
-            model.props[1].mole_frac_phase_comp["Liq", "toluene"]] == 1000
-        assert model.props[1].scaling_factor[
-            model.props[1].mole_frac_phase_comp["Vap", "benzene"]] == 1000
-        assert model.props[1].scaling_factor[
-            model.props[1].mole_frac_phase_comp["Vap", "toluene"]] == 1000
-        assert model.props[1].scaling_factor[model.props[1].pressure] == 1e-5
-        assert model.props[1].scaling_factor[
-            model.props[1].temperature] == 1e-2
-        assert model.props[1].scaling_factor[
-            model.props[1].temperature_bubble["Vap", "Liq"]] == 1e-2
-        assert model.props[1].scaling_factor[
-            model.props[1].temperature_dew["Vap", "Liq"]] == 1e-2
-
-    @pytest.mark.unit
-    def test_define_state_vars(self, model):
-        sv = model.props[1].define_state_vars()
-
-        assert len(sv) == 4
-        for i in sv:
-            assert i in ["flow_mol",
-                         "enth_mol",
-                         "pressure",
-                         "mole_frac_comp"]
+        sb = model.props[1]
+        expected = ComponentMap([
+            (sb._mole_frac_tbub["Vap", "Liq", "benzene"], 1000),
+            (sb._mole_frac_tbub["Vap", "Liq", "toluene"], 1000),
+            (sb._mole_frac_tdew["Vap", "Liq", "benzene"], 1000),
+            (sb._mole_frac_tdew["Vap", "Liq", "toluene"], 1000),
+            (sb._t1_Vap_Liq, 1e-2),
+            (sb._teq["Vap", "Liq"], 1e-2),
+            (sb.dens_mol_phase["Liq"], 1e-2),
+            (sb.dens_mol_phase["Vap"], 1e-2),
+            (sb.enth_mol, 1e-4),
+            (sb.flow_mol, 1e-2),
+            (sb.flow_mol_phase["Liq"], 1e-2),
+            (sb.flow_mol_phase["Vap"], 1e-2),
+            (sb.flow_mol_phase_comp["Liq", "benzene"], 1e-2),
+            (sb.flow_mol_phase_comp["Liq", "toluene"], 1e-2),
+            (sb.flow_mol_phase_comp["Vap", "benzene"], 1e-2),
+            (sb.flow_mol_phase_comp["Vap", "toluene"], 1e-2),
+            (sb.mole_frac_comp["benzene"], 1000),
+            (sb.mole_frac_comp["toluene"], 1000),
+            (sb.mole_frac_phase_comp["Liq", "benzene"], 1000),
+            (sb.mole_frac_phase_comp["Liq", "toluene"], 1000),
+            (sb.mole_frac_phase_comp["Vap", "benzene"], 1000),
+            (sb.mole_frac_phase_comp["Vap", "toluene"], 1000),
+            (sb.pressure, 1e-5),
+            (sb.temperature, 1e-2),
+            (sb.temperature_bubble["Vap", "Liq"], 1e-2),
+            (sb.temperature_dew["Vap", "Liq"], 1e-2)])
+
+        assert len(sb.scaling_factor) == len(expected) == 26
+        # Single pass over the suffix, checked against the expected map
+        for comp, sf in sb.scaling_factor.items():
+            assert sf == expected[comp]
 
     @pytest.mark.unit
-    def test_define_port_members(self, model):
-        sv = model.props[1].define_state_vars()
-
-        assert len(sv) == 4
-        for i in sv:
-            assert i in ["flow_mol",
-                         "enth_mol",
-                         "pressure",
-                         "mole_frac_comp"]
-
-    @pytest.mark.unit
-    def test_define_display_vars(self, model):
-        sv = model.props[1].define_display_vars()
-
-        assert len(sv) == 4
-        for i in sv:
-            assert i in ["Total Molar Flowrate",
-                         "Molar Enthalpy",
-                         "Pressure",
-                         "Total Mole Fraction"]
+    @pytest.mark.parametrize("method,expected", [
+        ("define_state_vars",
+         {"flow_mol", "enth_mol", "pressure", "mole_frac_comp"}),
+        ("define_port_members",
+         {"flow_mol", "enth_mol", "pressure", "mole_frac_comp"}),
+        ("define_display_vars",
+         {"Total Molar Flowrate", "Molar Enthalpy", "Pressure",
+          "Total Mole Fraction"})],
+        ids=["define_state_vars", "define_port_members",
+             "define_display_vars"])
+    def test_define_vars(self, model, method, expected):
+        sv = getattr(model.props[1], method)()
+
+        assert set(sv) == expected
 
     @pytest.mark.unit
     def test_dof(self, model):
         assert degrees_of_freedom(model.props[1]) == 0
 
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_initialize(self, model):
+    def test_initialize(self, model, solver):
         orig_fixed_vars = fixed_variables_set(model)
         orig_act_consts = activated_constraints_set(model)
 
-        model.props.initialize(optarg={'tol': 1e-6})
+        model.props.initialize()
 
         assert degrees_of_freedom(model) == 0
 
@@ -358,9 +346,8 @@ class TestStateBlock(object):
         for v in fin_fixed_vars:
             assert v in orig_fixed_vars
 
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solve(self, model):
+    def test_solve(self, model, solver):
         results = solver.solve(model)
 
         # Check for optimal solution
@@ -368,18 +355,23 @@ class TestStateBlock(object):
             TerminationCondition.optimal
         assert results.solver.status == SolverStatus.ok
 
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solution(self, model):
+    def test_solution(self, model, solver):
         # Check phase equilibrium results
-        assert model.props[1].mole_frac_phase_comp["Liq", "benzene"].value == \
-            pytest.approx(0.4121, abs=1e-4)
-        assert model.props[1].mole_frac_phase_comp["Vap", "benzene"].value == \
-            pytest.approx(0.6339, abs=1e-4)
-        assert model.props[1].phase_frac["Vap"].value == \
-            pytest.approx(0.3961, abs=1e-4)
+        sb = model.props[1]
+        results = {
+            "Liq_benzene": sb.mole_frac_phase_comp["Liq", "benzene"].value,
+            "Vap_benzene": sb.mole_frac_phase_comp["Vap", "benzene"].value,
+            "phase_frac_Vap": sb.phase_frac["Vap"].value}
+
+        assert results == pytest.approx({"Liq_benzene": 0.4121,
+                                         "Vap_benzene": 0.6339,
+                                         "phase_frac_Vap": 0.3961},
+                                        abs=1e-4)
 
     @pytest.mark.ui
-    @pytest.mark.unit
-    def test_report(self, model):
+    @pytest.mark.component
+    def test_report(self, model, capsys):
         model.props[1].report()
+
+        assert capsys.readouterr().out
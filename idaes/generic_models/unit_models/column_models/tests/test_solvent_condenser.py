@@ -27,86 +27,127 @@ from pyomo.util.check_units import (assert_units_consistent,
                                     assert_units_equivalent)
 
 from idaes.core import FlowsheetBlock
-from idaes.generic_models.properties.core.generic.generic_property import (
-        GenericParameterBlock)
 from idaes.core.util.model_statistics import (degrees_of_freedom,
                                               number_variables,
                                               number_total_constraints,
                                               number_unused_variables)
 from idaes.core.util.testing import initialization_tester
-from idaes.core.util import get_solver, scaling as iscale
-
-from idaes.generic_models.unit_models.column_models.solvent_condenser import (
-    SolventCondenser)
-from idaes.power_generation.carbon_capture.mea_solvent_system.properties.MEA_solvent \
-    import configuration as aqueous_mea
-from idaes.power_generation.carbon_capture.mea_solvent_system.properties.MEA_vapor \
-    import wet_co2
+from idaes.core.util import scaling as iscale
 
 
 # -----------------------------------------------------------------------------
-# Get default solver for testing
-solver = get_solver()
+@pytest.fixture(scope="module")
+def base_model():
+    # Constructing the property packages dominates the cost of these tests, so
+    # build them once and give each specification its own clone.
+    # The model and property imports are deferred to here so that collecting
+    # this module does not load the MEA property packages.
+    from idaes.generic_models.properties.core.generic.generic_property import (
+        GenericParameterBlock)
+    from idaes.generic_models.unit_models.column_models.solvent_condenser \
+        import SolventCondenser
+    from idaes.power_generation.carbon_capture.mea_solvent_system.properties.MEA_solvent \
+        import configuration as aqueous_mea
+    from idaes.power_generation.carbon_capture.mea_solvent_system.properties.MEA_vapor \
+        import wet_co2
+
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(default={"dynamic": False})
+
+    m.fs.liquid_properties = GenericParameterBlock(default=aqueous_mea)
+    m.fs.vapor_properties = GenericParameterBlock(default=wet_co2)
+
+    m.fs.unit = SolventCondenser(default={
+        "liquid_property_package": m.fs.liquid_properties,
+        "vapor_property_package": m.fs.vapor_properties})
+
+    return m
+
+
+@pytest.mark.build
+@pytest.mark.unit
+def test_build(base_model):
+    # Structure does not depend on the chosen specification, so check it once
+    # on the shared model rather than for every case
+    model = base_model
+
+    assert hasattr(model.fs.unit, "inlet")
+    assert len(model.fs.unit.inlet.vars) == 4
+    assert hasattr(model.fs.unit.inlet, "flow_mol")
+    assert hasattr(model.fs.unit.inlet, "mole_frac_comp")
+    assert hasattr(model.fs.unit.inlet, "temperature")
+    assert hasattr(model.fs.unit.inlet, "pressure")
+
+    assert hasattr(model.fs.unit, "reflux")
+    assert len(model.fs.unit.reflux.vars) == 4
+    assert hasattr(model.fs.unit.reflux, "flow_mol")
+    assert hasattr(model.fs.unit.reflux, "mole_frac_comp")
+    assert hasattr(model.fs.unit.reflux, "temperature")
+    assert hasattr(model.fs.unit.reflux, "pressure")
+
+    assert hasattr(model.fs.unit, "vapor_outlet")
+    assert len(model.fs.unit.vapor_outlet.vars) == 4
+    assert hasattr(model.fs.unit.vapor_outlet, "flow_mol")
+    assert hasattr(model.fs.unit.vapor_outlet, "mole_frac_comp")
+    assert hasattr(model.fs.unit.vapor_outlet, "temperature")
+    assert hasattr(model.fs.unit.vapor_outlet, "pressure")
+
+    assert isinstance(model.fs.unit.unit_material_balance, Constraint)
+    assert isinstance(model.fs.unit.unit_enthalpy_balance, Constraint)
+    assert isinstance(model.fs.unit.unit_temperature_equality, Constraint)
+    assert isinstance(model.fs.unit.unit_pressure_balance, Constraint)
+    assert isinstance(model.fs.unit.zero_flow_param, Param)
+
+    assert number_variables(model.fs.unit) == 55
+    assert number_total_constraints(model.fs.unit) == 49
+    assert number_unused_variables(model.fs.unit) == 0
 
 
 # -----------------------------------------------------------------------------
-class TestStripperVaporFlow(object):
-    @pytest.fixture(scope="class")
-    def model(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.liquid_properties = GenericParameterBlock(default=aqueous_mea)
-        m.fs.vapor_properties = GenericParameterBlock(default=wet_co2)
-
-        m.fs.unit = SolventCondenser(default={
-            "liquid_property_package": m.fs.liquid_properties,
-            "vapor_property_package": m.fs.vapor_properties})
+# Inlet conditions shared by all cases
+_INLET = {"flow_mol": 1.1117,
+          "temperature": 339.33,
+          "pressure": 184360}
+_INLET_MOLE_FRAC = {"CO2": 0.8817,
+                    "H2O": 0.1183}
+
+# Expected results for each choice of condenser specification
+_SOLUTIONS = {
+    "reflux_flow": {"reflux_flow": 0.1083,
+                    "temperature": 303.244,
+                    "vapor_H2O": 0.0232416,
+                    "heat_duty": -6264.72},
+    "heat_duty": {"reflux_flow": 0.108291,
+                  "temperature": 303.250,
+                  "vapor_H2O": 0.0232505,
+                  "heat_duty": -6264}}
+
+
+def _specified_model(base_model, spec):
+    # Clone the shared model and fix the inlet and the given specification
+    m = base_model.clone()
+
+    for k, v in _INLET.items():
+        getattr(m.fs.unit.inlet, k)[0].fix(v)
+    for j, v in _INLET_MOLE_FRAC.items():
+        m.fs.unit.inlet.mole_frac_comp[0, j].fix(v)
+
+    if spec == "reflux_flow":
+        m.fs.unit.reflux.flow_mol[0].fix(0.1083)
+    else:
+        m.fs.unit.heat_duty.fix(-6264)
 
-        m.fs.unit.inlet.flow_mol[0].fix(1.1117)
-        m.fs.unit.inlet.temperature[0].fix(339.33)
-        m.fs.unit.inlet.pressure[0].fix(184360)
-        m.fs.unit.inlet.mole_frac_comp[0, "CO2"].fix(0.8817)
-        m.fs.unit.inlet.mole_frac_comp[0, "H2O"].fix(0.1183)
+    return m
 
-        m.fs.unit.reflux.flow_mol[0].fix(0.1083)
 
-        return m
+class TestStripper(object):
+    @pytest.fixture(scope="class", params=["reflux_flow", "heat_duty"])
+    def spec(self, request):
+        return request.param
 
-    @pytest.mark.build
-    @pytest.mark.unit
-    def test_build(self, model):
-
-        assert hasattr(model.fs.unit, "inlet")
-        assert len(model.fs.unit.inlet.vars) == 4
-        assert hasattr(model.fs.unit.inlet, "flow_mol")
-        assert hasattr(model.fs.unit.inlet, "mole_frac_comp")
-        assert hasattr(model.fs.unit.inlet, "temperature")
-        assert hasattr(model.fs.unit.inlet, "pressure")
-
-        assert hasattr(model.fs.unit, "reflux")
-        assert len(model.fs.unit.reflux.vars) == 4
-        assert hasattr(model.fs.unit.reflux, "flow_mol")
-        assert hasattr(model.fs.unit.reflux, "mole_frac_comp")
-        assert hasattr(model.fs.unit.reflux, "temperature")
-        assert hasattr(model.fs.unit.reflux, "pressure")
-
-        assert hasattr(model.fs.unit, "vapor_outlet")
-        assert len(model.fs.unit.vapor_outlet.vars) == 4
-        assert hasattr(model.fs.unit.vapor_outlet, "flow_mol")
-        assert hasattr(model.fs.unit.vapor_outlet, "mole_frac_comp")
-        assert hasattr(model.fs.unit.vapor_outlet, "temperature")
-        assert hasattr(model.fs.unit.vapor_outlet, "pressure")
-
-        assert isinstance(model.fs.unit.unit_material_balance, Constraint)
-        assert isinstance(model.fs.unit.unit_enthalpy_balance, Constraint)
-        assert isinstance(model.fs.unit.unit_temperature_equality, Constraint)
-        assert isinstance(model.fs.unit.unit_pressure_balance, Constraint)
-        assert isinstance(model.fs.unit.zero_flow_param, Param)
-
-        assert number_variables(model.fs.unit) == 55
-        assert number_total_constraints(model.fs.unit) == 49
-        assert number_unused_variables(model.fs.unit) == 0
+    @pytest.fixture(scope="class")
+    def model(self, base_model, spec):
+        return _specified_model(base_model, spec)
 
     @pytest.mark.component
     def test_units(self, model):
@@ -118,15 +159,13 @@ class TestStripperVaporFlow(object):
         assert degrees_of_freedom(model) == 0
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_initialize(self, model):
+    def test_initialize(self, model, solver):
         initialization_tester(model)
 
     # @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solve(self, model):
+    def test_solve(self, model, solver):
         results = solver.solve(model)
 
         # Check for optimal solution
@@ -135,10 +174,11 @@ class TestStripperVaporFlow(object):
         assert results.solver.status == SolverStatus.ok
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solution(self, model):
-        assert (pytest.approx(0.1083, rel=1e-5) ==
+    def test_solution(self, model, spec, solver):
+        expected = _SOLUTIONS[spec]
+
+        assert (pytest.approx(expected["reflux_flow"], rel=1e-5) ==
                 value(model.fs.unit.reflux.flow_mol[0]))
         assert (pytest.approx(0, abs=1e-3) ==
                 value(model.fs.unit.reflux.mole_frac_comp[0, 'CO2']))
@@ -148,236 +188,84 @@ class TestStripperVaporFlow(object):
                 value(model.fs.unit.reflux.mole_frac_comp[0, 'H2O']))
         assert (pytest.approx(184360, rel=1e-5) ==
                 value(model.fs.unit.reflux.pressure[0]))
-        assert (pytest.approx(303.244, rel=1e-5) ==
+        assert (pytest.approx(expected["temperature"], rel=1e-5) ==
                 value(model.fs.unit.reflux.temperature[0]))
 
         assert (pytest.approx(1.0034, rel=1e-5) ==
                 value(model.fs.unit.vapor_outlet.flow_mol[0]))
         assert (pytest.approx(0.976758, rel=1e-5) ==
                 value(model.fs.unit.vapor_outlet.mole_frac_comp[0, 'CO2']))
-        assert (pytest.approx(0.0232416, rel=1e-5) ==
+        assert (pytest.approx(expected["vapor_H2O"], rel=1e-5) ==
                 value(model.fs.unit.vapor_outlet.mole_frac_comp[0, 'H2O']))
         assert (pytest.approx(184360, rel=1e-5) ==
                 value(model.fs.unit.vapor_outlet.pressure[0]))
-        assert (pytest.approx(303.244, rel=1e-5) ==
+        assert (pytest.approx(expected["temperature"], rel=1e-5) ==
                 value(model.fs.unit.vapor_outlet.temperature[0]))
 
-        assert (pytest.approx(-6264.72, rel=1e-5) ==
+        assert (pytest.approx(expected["heat_duty"], rel=1e-5) ==
                 value(model.fs.unit.heat_duty[0]))
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_conservation(self, model):
-        assert abs(value(model.fs.unit.inlet.flow_mol[0] -
-                         model.fs.unit.reflux.flow_mol[0] -
-                         model.fs.unit.vapor_outlet.flow_mol[0])) <= 1e-6
-
-        assert (abs(value(model.fs.unit.inlet.flow_mol[0] *
-                          model.fs.unit.inlet.mole_frac_comp[0, "CO2"] -
-                          model.fs.unit.reflux.flow_mol[0] *
-                          model.fs.unit.reflux.mole_frac_comp[0, "CO2"] -
-                          model.fs.unit.vapor_outlet.flow_mol[0] *
-                          model.fs.unit.vapor_outlet.mole_frac_comp[0, "CO2"]))
-                <= 1e-6)
-        assert (abs(value(model.fs.unit.inlet.flow_mol[0] *
-                          model.fs.unit.inlet.mole_frac_comp[0, "H2O"] -
-                          model.fs.unit.reflux.flow_mol[0] *
-                          model.fs.unit.reflux.mole_frac_comp[0, "H2O"] -
-                          model.fs.unit.vapor_outlet.flow_mol[0] *
-                          model.fs.unit.vapor_outlet.mole_frac_comp[0, "H2O"]))
-                <= 1e-6)
-        assert (abs(value(model.fs.unit.reflux.flow_mol[0] *
-                          model.fs.unit.reflux.mole_frac_comp[0, "MEA"]))
+    def test_conservation(self, model, solver):
+        unit = model.fs.unit
+
+        # Read each value once and check the balances using plain floats
+        f_in = value(unit.inlet.flow_mol[0])
+        f_reflux = value(unit.reflux.flow_mol[0])
+        f_vap = value(unit.vapor_outlet.flow_mol[0])
+
+        assert abs(f_in - f_reflux - f_vap) <= 1e-6
+
+        for j in ["CO2", "H2O"]:
+            assert (abs(f_in * value(unit.inlet.mole_frac_comp[0, j]) -
+                        f_reflux * value(unit.reflux.mole_frac_comp[0, j]) -
+                        f_vap * value(unit.vapor_outlet.mole_frac_comp[0, j]))
+                    <= 1e-6)
+        assert (abs(f_reflux * value(unit.reflux.mole_frac_comp[0, "MEA"]))
                 <= 1e-6)
 
-        assert abs(value(
-            model.fs.unit.vapor_phase.properties_in[0]._enthalpy_flow_term[
-                "Vap"] -
-            model.fs.unit.vapor_phase.properties_out[0]._enthalpy_flow_term[
-                "Vap"] -
-            model.fs.unit.liquid_phase[0]._enthalpy_flow_term["Liq"] +
-            model.fs.unit.heat_duty[0])) <= 1e-6
-
-
-# -----------------------------------------------------------------------------
-class TestStripperHeatDuty(object):
-    @pytest.fixture(scope="class")
-    def model(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.liquid_properties = GenericParameterBlock(default=aqueous_mea)
-        m.fs.vapor_properties = GenericParameterBlock(default=wet_co2)
+        h_in = value(
+            unit.vapor_phase.properties_in[0]._enthalpy_flow_term["Vap"])
+        h_vap = value(
+            unit.vapor_phase.properties_out[0]._enthalpy_flow_term["Vap"])
+        h_liq = value(unit.liquid_phase[0]._enthalpy_flow_term["Liq"])
 
-        m.fs.unit = SolventCondenser(default={
-            "liquid_property_package": m.fs.liquid_properties,
-            "vapor_property_package": m.fs.vapor_properties})
+        assert abs(h_in - h_vap - h_liq + value(unit.heat_duty[0])) <= 1e-6
 
-        m.fs.unit.inlet.flow_mol[0].fix(1.1117)
-        m.fs.unit.inlet.temperature[0].fix(339.33)
-        m.fs.unit.inlet.pressure[0].fix(184360)
-        m.fs.unit.inlet.mole_frac_comp[0, "CO2"].fix(0.8817)
-        m.fs.unit.inlet.mole_frac_comp[0, "H2O"].fix(0.1183)
 
-        m.fs.unit.heat_duty.fix(-6264)
+@pytest.mark.component
+def test_scaling(base_model):
+    # Scaling is checked on its own heat duty model, so the solves above run
+    # on the unscaled model that the expected solutions were obtained from
+    model = _specified_model(base_model, "heat_duty")
 
-        return m
+    iscale.set_scaling_factor(
+        model.fs.unit.vapor_phase.properties_out[0].fug_phase_comp[
+            "Vap", "CO2"], 1e-5)
+    iscale.set_scaling_factor(
+        model.fs.unit.vapor_phase.properties_out[0].fug_phase_comp[
+            "Vap", "H2O"], 1e-3)
 
-    @pytest.mark.build
-    @pytest.mark.unit
-    def test_build(self, model):
-
-        assert hasattr(model.fs.unit, "inlet")
-        assert len(model.fs.unit.inlet.vars) == 4
-        assert hasattr(model.fs.unit.inlet, "flow_mol")
-        assert hasattr(model.fs.unit.inlet, "mole_frac_comp")
-        assert hasattr(model.fs.unit.inlet, "temperature")
-        assert hasattr(model.fs.unit.inlet, "pressure")
-
-        assert hasattr(model.fs.unit, "reflux")
-        assert len(model.fs.unit.reflux.vars) == 4
-        assert hasattr(model.fs.unit.reflux, "flow_mol")
-        assert hasattr(model.fs.unit.reflux, "mole_frac_comp")
-        assert hasattr(model.fs.unit.reflux, "temperature")
-        assert hasattr(model.fs.unit.reflux, "pressure")
-
-        assert hasattr(model.fs.unit, "vapor_outlet")
-        assert len(model.fs.unit.vapor_outlet.vars) == 4
-        assert hasattr(model.fs.unit.vapor_outlet, "flow_mol")
-        assert hasattr(model.fs.unit.vapor_outlet, "mole_frac_comp")
-        assert hasattr(model.fs.unit.vapor_outlet, "temperature")
-        assert hasattr(model.fs.unit.vapor_outlet, "pressure")
-
-        assert isinstance(model.fs.unit.unit_material_balance, Constraint)
-        assert isinstance(model.fs.unit.unit_enthalpy_balance, Constraint)
-        assert isinstance(model.fs.unit.unit_temperature_equality, Constraint)
-        assert isinstance(model.fs.unit.unit_pressure_balance, Constraint)
-        assert isinstance(model.fs.unit.zero_flow_param, Param)
-
-        assert number_variables(model.fs.unit) == 55
-        assert number_total_constraints(model.fs.unit) == 49
-        assert number_unused_variables(model.fs.unit) == 0
+    iscale.calculate_scaling_factors(model.fs.unit)
 
-    @pytest.mark.component
-    def test_units(self, model):
-        assert_units_consistent(model)
-        assert_units_equivalent(model.fs.unit.heat_duty[0], units.W)
+    assert iscale.get_constraint_transform_applied_scaling_factor(
+        model.fs.unit.unit_material_balance[0, "CO2"]) == 1
+    assert iscale.get_constraint_transform_applied_scaling_factor(
+        model.fs.unit.unit_material_balance[0, "H2O"]) == 1
+    assert iscale.get_constraint_transform_applied_scaling_factor(
+        model.fs.unit.unit_material_balance[0, "MEA"]) == 1e8
 
-    @pytest.mark.unit
-    def test_dof(self, model):
-        assert degrees_of_freedom(model) == 0
+    assert iscale.get_constraint_transform_applied_scaling_factor(
+        model.fs.unit.unit_phase_equilibrium[0, "CO2"]) == 1e-5
+    assert iscale.get_constraint_transform_applied_scaling_factor(
+        model.fs.unit.unit_phase_equilibrium[0, "H2O"]) == 1e-3
 
-    @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
-    @pytest.mark.component
-    def test_initialize(self, model):
-        initialization_tester(model)
+    assert iscale.get_constraint_transform_applied_scaling_factor(
+        model.fs.unit.unit_temperature_equality[0]) == 1e-2
 
-    # @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
-    @pytest.mark.component
-    def test_solve(self, model):
-        results = solver.solve(model)
+    assert iscale.get_constraint_transform_applied_scaling_factor(
+        model.fs.unit.unit_enthalpy_balance[0]) == 1
 
-        # Check for optimal solution
-        assert results.solver.termination_condition == \
-            TerminationCondition.optimal
-        assert results.solver.status == SolverStatus.ok
-
-    @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
-    @pytest.mark.component
-    def test_solution(self, model):
-        assert (pytest.approx(0.108291, rel=1e-5) ==
-                value(model.fs.unit.reflux.flow_mol[0]))
-        assert (pytest.approx(0, abs=1e-3) ==
-                value(model.fs.unit.reflux.mole_frac_comp[0, 'CO2']))
-        assert (pytest.approx(0, abs=1e-3) ==
-                value(model.fs.unit.reflux.mole_frac_comp[0, 'MEA']))
-        assert (pytest.approx(1, rel=1e-3) ==
-                value(model.fs.unit.reflux.mole_frac_comp[0, 'H2O']))
-        assert (pytest.approx(184360, rel=1e-5) ==
-                value(model.fs.unit.reflux.pressure[0]))
-        assert (pytest.approx(303.250, rel=1e-5) ==
-                value(model.fs.unit.reflux.temperature[0]))
-
-        assert (pytest.approx(1.0034, rel=1e-5) ==
-                value(model.fs.unit.vapor_outlet.flow_mol[0]))
-        assert (pytest.approx(0.976758, rel=1e-5) ==
-                value(model.fs.unit.vapor_outlet.mole_frac_comp[0, 'CO2']))
-        assert (pytest.approx(0.0232505, rel=1e-5) ==
-                value(model.fs.unit.vapor_outlet.mole_frac_comp[0, 'H2O']))
-        assert (pytest.approx(184360, rel=1e-5) ==
-                value(model.fs.unit.vapor_outlet.pressure[0]))
-        assert (pytest.approx(303.250, rel=1e-5) ==
-                value(model.fs.unit.vapor_outlet.temperature[0]))
-
-        assert (pytest.approx(-6264, rel=1e-5) ==
-                value(model.fs.unit.heat_duty[0]))
-
-    @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
-    @pytest.mark.component
-    def test_conservation(self, model):
-        assert abs(value(model.fs.unit.inlet.flow_mol[0] -
-                         model.fs.unit.reflux.flow_mol[0] -
-                         model.fs.unit.vapor_outlet.flow_mol[0])) <= 1e-6
-
-        assert (abs(value(model.fs.unit.inlet.flow_mol[0] *
-                          model.fs.unit.inlet.mole_frac_comp[0, "CO2"] -
-                          model.fs.unit.reflux.flow_mol[0] *
-                          model.fs.unit.reflux.mole_frac_comp[0, "CO2"] -
-                          model.fs.unit.vapor_outlet.flow_mol[0] *
-                          model.fs.unit.vapor_outlet.mole_frac_comp[0, "CO2"]))
-                <= 1e-6)
-        assert (abs(value(model.fs.unit.inlet.flow_mol[0] *
-                          model.fs.unit.inlet.mole_frac_comp[0, "H2O"] -
-                          model.fs.unit.reflux.flow_mol[0] *
-                          model.fs.unit.reflux.mole_frac_comp[0, "H2O"] -
-                          model.fs.unit.vapor_outlet.flow_mol[0] *
-                          model.fs.unit.vapor_outlet.mole_frac_comp[0, "H2O"]))
-                <= 1e-6)
-        assert (abs(value(model.fs.unit.reflux.flow_mol[0] *
-                          model.fs.unit.reflux.mole_frac_comp[0, "MEA"]))
-                <= 1e-6)
-
-        assert abs(value(
-            model.fs.unit.vapor_phase.properties_in[0]._enthalpy_flow_term[
-                "Vap"] -
-            model.fs.unit.vapor_phase.properties_out[0]._enthalpy_flow_term[
-                "Vap"] -
-            model.fs.unit.liquid_phase[0]._enthalpy_flow_term["Liq"] +
-            model.fs.unit.heat_duty[0])) <= 1e-6
-
-    @pytest.mark.component
-    def test_scaling(self, model):
-        iscale.set_scaling_factor(
-            model.fs.unit.vapor_phase.properties_out[0].fug_phase_comp[
-                "Vap", "CO2"], 1e-5)
-        iscale.set_scaling_factor(
-            model.fs.unit.vapor_phase.properties_out[0].fug_phase_comp[
-                "Vap", "H2O"], 1e-3)
-
-        iscale.calculate_scaling_factors(model.fs.unit)
-
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.unit_material_balance[0, "CO2"]) == 1
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.unit_material_balance[0, "H2O"]) == 1
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.unit_material_balance[0, "MEA"]) == 1e8
-
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.unit_phase_equilibrium[0, "CO2"]) == 1e-5
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.unit_phase_equilibrium[0, "H2O"]) == 1e-3
-
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.unit_temperature_equality[0]) == 1e-2
-
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.unit_enthalpy_balance[0]) == 1
-
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.unit_pressure_balance[0]) == 1e-5
+    assert iscale.get_constraint_transform_applied_scaling_factor(
+        model.fs.unit.unit_pressure_balance[0]) == 1e-5
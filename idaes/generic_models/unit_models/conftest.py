@@ -0,0 +1,27 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+import pytest
+
+from idaes.core.util import get_solver
+
+
+@pytest.fixture(scope="module")
+def solver():
+    # Resolved on first use, so collecting a module or running only the unit
+    # tests never probes for Ipopt. Tests that need a solver request this
+    # fixture, which skips them if Ipopt is not available.
+    # Ipopt's iteration log is not needed
+    solver = get_solver(options={"print_level": 0})
+    if not solver.available(exception_flag=False):
+        pytest.skip("Solver not available")
+    return solver
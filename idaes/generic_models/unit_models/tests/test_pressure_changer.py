@@ -55,12 +55,32 @@ from idaes.core.util.model_statistics import (degrees_of_freedom,
 from idaes.core.util.testing import (PhysicalParameterTestBlock,
                                      initialization_tester)
 from idaes.core.util.exceptions import BalanceTypeNotSupportedError
-from idaes.core.util import get_solver, scaling as iscale
+from idaes.core.util import scaling as iscale
 
 
 # -----------------------------------------------------------------------------
-# Get default solver for testing
-solver = get_solver()
+@pytest.fixture(scope="module")
+def physical_test_base():
+    # Steady-state flowsheet with the test property package, built once and
+    # cloned by each test that adds a unit to it
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(default={"dynamic": False})
+
+    m.fs.properties = PhysicalParameterTestBlock()
+
+    return m
+
+
+@pytest.fixture(scope="module")
+def iapws_base():
+    # The IAPWS-95 parameter block is expensive to construct, so build it once
+    # and give each test its own clone
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(default={"dynamic": False})
+
+    m.fs.properties = iapws95.Iapws95ParameterBlock()
+
+    return m
 
 
 # -----------------------------------------------------------------------------
@@ -71,11 +91,8 @@ def test_ThermodynamicAssumption():
 
 class TestPressureChanger(object):
     @pytest.mark.unit
-    def test_config(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.properties = PhysicalParameterTestBlock()
+    def test_config(self, physical_test_base):
+        m = physical_test_base.clone()
 
         m.fs.unit = PressureChanger(default={
                 "property_package": m.fs.properties})
@@ -109,102 +126,57 @@ class TestPressureChanger(object):
         assert hasattr(m.fs.unit, "volume")
 
     @pytest.mark.unit
-    def test_pump(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.properties = PhysicalParameterTestBlock()
-
-        m.fs.unit = PressureChanger(default={
-                "property_package": m.fs.properties,
-                "thermodynamic_assumption": ThermodynamicAssumption.pump})
-        iscale.calculate_scaling_factors(m)
-
-        assert isinstance(m.fs.unit.fluid_work_calculation, Constraint)
-
-    @pytest.mark.unit
-    def test_adiabatic(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.properties = PhysicalParameterTestBlock()
-
-        m.fs.unit = PressureChanger(default={
-                "property_package": m.fs.properties,
-                "thermodynamic_assumption": ThermodynamicAssumption.adiabatic})
-        iscale.calculate_scaling_factors(m)
-
-
-    @pytest.mark.unit
-    def test_isentropic_comp_phase_balances(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.properties = PhysicalParameterTestBlock()
+    @pytest.mark.parametrize("assumption,constraints", [
+        (ThermodynamicAssumption.isothermal, ["isothermal"]),
+        (ThermodynamicAssumption.pump,
+         ["fluid_work_calculation", "actual_work"]),
+        (ThermodynamicAssumption.adiabatic, ["zero_work_equation"])],
+        ids=["isothermal", "pump", "adiabatic"])
+    def test_thermodynamic_assumption(
+            self, physical_test_base, assumption, constraints):
+        m = physical_test_base.clone()
 
         m.fs.unit = PressureChanger(default={
                 "property_package": m.fs.properties,
-                "thermodynamic_assumption": ThermodynamicAssumption.isentropic,
-                "material_balance_type": MaterialBalanceType.componentPhase})
+                "thermodynamic_assumption": assumption})
         iscale.calculate_scaling_factors(m)
 
-        assert isinstance(m.fs.unit.state_material_balances, Constraint)
-        assert len(m.fs.unit.state_material_balances) == 4
+        for c in constraints:
+            assert isinstance(getattr(m.fs.unit, c), Constraint)
 
     @pytest.mark.unit
-    def test_isentropic_comp_total_balances(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.properties = PhysicalParameterTestBlock()
+    @pytest.mark.parametrize("balance_type,n_balances", [
+        (MaterialBalanceType.componentPhase, 4),
+        (MaterialBalanceType.componentTotal, 2)],
+        ids=["componentPhase", "componentTotal"])
+    def test_isentropic_material_balances(
+            self, physical_test_base, balance_type, n_balances):
+        m = physical_test_base.clone()
 
         m.fs.unit = PressureChanger(default={
                 "property_package": m.fs.properties,
                 "thermodynamic_assumption": ThermodynamicAssumption.isentropic,
-                "material_balance_type": MaterialBalanceType.componentTotal})
+                "material_balance_type": balance_type})
         iscale.calculate_scaling_factors(m)
 
         assert isinstance(m.fs.unit.state_material_balances, Constraint)
-        assert len(m.fs.unit.state_material_balances) == 2
-
-    @pytest.mark.unit
-    def test_isentropic_total_balances(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.properties = PhysicalParameterTestBlock()
-
-        with pytest.raises(BalanceTypeNotSupportedError):
-            m.fs.unit = PressureChanger(default={
-                "property_package": m.fs.properties,
-                "thermodynamic_assumption": ThermodynamicAssumption.isentropic,
-                "material_balance_type": MaterialBalanceType.total})
-
-    @pytest.mark.unit
-    def test_isentropic_total_element_balances(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.properties = PhysicalParameterTestBlock()
-
-        with pytest.raises(BalanceTypeNotSupportedError):
-            m.fs.unit = PressureChanger(default={
-                "property_package": m.fs.properties,
-                "thermodynamic_assumption": ThermodynamicAssumption.isentropic,
-                "material_balance_type": MaterialBalanceType.elementTotal})
+        assert len(m.fs.unit.state_material_balances) == n_balances
 
     @pytest.mark.unit
-    def test_isentropic_material_balances_none(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.properties = PhysicalParameterTestBlock()
+    @pytest.mark.parametrize("balance_type", [
+        MaterialBalanceType.total,
+        MaterialBalanceType.elementTotal,
+        MaterialBalanceType.none],
+        ids=["total", "elementTotal", "none"])
+    def test_isentropic_material_balances_not_supported(
+            self, physical_test_base, balance_type):
+        m = physical_test_base.clone()
 
         with pytest.raises(BalanceTypeNotSupportedError):
             m.fs.unit = PressureChanger(default={
                 "property_package": m.fs.properties,
                 "thermodynamic_assumption": ThermodynamicAssumption.isentropic,
-                "material_balance_type": MaterialBalanceType.none})
+                "material_balance_type": balance_type})
 
 
 # -----------------------------------------------------------------------------
@@ -268,15 +240,13 @@ class TestBTX_isothermal(object):
         assert degrees_of_freedom(btx) == 0
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_initialize(self, btx):
+    def test_initialize(self, btx, solver):
         initialization_tester(btx)
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solve(self, btx):
+    def test_solve(self, btx, solver):
         results = solver.solve(btx)
 
         # Check for optimal solution
@@ -285,9 +255,8 @@ class TestBTX_isothermal(object):
         assert results.solver.status == SolverStatus.ok
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solution(self, btx):
+    def test_solution(self, btx, solver):
         assert (pytest.approx(5, abs=1e-3) ==
                 value(btx.fs.unit.outlet.flow_mol[0]))
         assert (pytest.approx(365, abs=1e-2) ==
@@ -298,9 +267,8 @@ class TestBTX_isothermal(object):
                 value(btx.fs.unit.work_mechanical[0]))
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_conservation(self, btx):
+    def test_conservation(self, btx, solver):
         assert abs(value(btx.fs.unit.inlet.flow_mol[0] -
                          btx.fs.unit.outlet.flow_mol[0])) <= 1e-6
 
@@ -322,11 +290,8 @@ class TestBTX_isothermal(object):
                     reason="IAPWS not available")
 class TestIAPWS(object):
     @pytest.fixture(scope="class")
-    def iapws(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.properties = iapws95.Iapws95ParameterBlock()
+    def iapws(self, iapws_base):
+        m = iapws_base.clone()
 
         m.fs.unit = PressureChanger(default={
                 "property_package": m.fs.properties,
@@ -344,11 +309,8 @@ class TestIAPWS(object):
         return m
 
     @pytest.fixture(scope="class")
-    def iapws_turb(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.properties = iapws95.Iapws95ParameterBlock()
+    def iapws_turb(self, iapws_base):
+        m = iapws_base.clone()
 
         m.fs.unit = PressureChanger(default={
                 "property_package": m.fs.properties,
@@ -401,15 +363,13 @@ class TestIAPWS(object):
         assert degrees_of_freedom(iapws) == 0
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_initialize(self, iapws):
+    def test_initialize(self, iapws, solver):
         initialization_tester(iapws)
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solve(self, iapws):
+    def test_solve(self, iapws, solver):
         results = solver.solve(iapws)
 
         # Check for optimal solution
@@ -418,9 +378,8 @@ class TestIAPWS(object):
         assert results.solver.status == SolverStatus.ok
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solution(self, iapws):
+    def test_solution(self, iapws, solver):
         # Check that outlet and isentropic pressure are equal
         assert pytest.approx(
             value(iapws.fs.unit.properties_isentropic[0].pressure), 1e-6) == \
@@ -454,9 +413,8 @@ class TestIAPWS(object):
             value(iapws.fs.unit.properties_isentropic[0].temperature)
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_conservation(self, iapws):
+    def test_conservation(self, iapws, solver):
         assert abs(value(iapws.fs.unit.inlet.flow_mol[0] -
                          iapws.fs.unit.outlet.flow_mol[0])) <= 1e-6
 
@@ -467,9 +425,8 @@ class TestIAPWS(object):
                    iapws.fs.unit.work_mechanical[0])) <= 1e-6
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.integration
-    def test_verify(self, iapws_turb):
+    def test_verify(self, iapws_turb, solver):
         iapws = iapws_turb
         # Verify the turbine results against 3 known test cases
         # Case Data (90% isentropic efficency)
@@ -598,15 +555,13 @@ class TestSaponification(object):
         assert degrees_of_freedom(sapon) == 0
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_initialize(self, sapon):
+    def test_initialize(self, sapon, solver):
         initialization_tester(sapon)
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solve(self, sapon):
+    def test_solve(self, sapon, solver):
         results = solver.solve(sapon)
 
         # Check for optimal solution
@@ -615,9 +570,8 @@ class TestSaponification(object):
         assert results.solver.status == SolverStatus.ok
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solution(self, sapon):
+    def test_solution(self, sapon, solver):
         assert pytest.approx(1e-3, abs=1e-6) == \
             value(sapon.fs.unit.outlet.flow_vol[0])
 
@@ -644,9 +598,8 @@ class TestSaponification(object):
             value(sapon.fs.unit.work_fluid[0])
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_conservation(self, sapon):
+    def test_conservation(self, sapon, solver):
         assert abs(value(
                 sapon.fs.unit.outlet.flow_vol[0] *
                 sapon.fs.properties.dens_mol*sapon.fs.properties.cp_mol *
@@ -662,11 +615,8 @@ class TestSaponification(object):
 
 class TestTurbine(object):
     @pytest.mark.unit
-    def test_config(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.properties = PhysicalParameterTestBlock()
+    def test_config(self, physical_test_base):
+        m = physical_test_base.clone()
 
         m.fs.unit = Turbine(default={
                 "property_package": m.fs.properties})
@@ -693,11 +643,8 @@ class TestTurbine(object):
 
 class TestCompressor(object):
     @pytest.mark.unit
-    def test_config(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.properties = PhysicalParameterTestBlock()
+    def test_config(self, physical_test_base):
+        m = physical_test_base.clone()
 
         m.fs.unit = Compressor(default={
                 "property_package": m.fs.properties})
@@ -724,11 +671,8 @@ class TestCompressor(object):
 
 class TestPump(object):
     @pytest.mark.unit
-    def test_config(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-
-        m.fs.properties = PhysicalParameterTestBlock()
+    def test_config(self, physical_test_base):
+        m = physical_test_base.clone()
 
         m.fs.unit = Pump(default={
                 "property_package": m.fs.properties})
@@ -755,13 +699,10 @@ class TestPump(object):
 
 @pytest.mark.skipif(not iapws95.iapws95_available(),
                     reason="IAPWS not available")
-@pytest.mark.skipif(solver is None, reason="Solver not available")
 class Test_costing(object):
     @pytest.mark.component
-    def test_pump(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-        m.fs.properties = iapws95.Iapws95ParameterBlock()
+    def test_pump(self, iapws_base, solver):
+        m = iapws_base.clone()
         m.fs.unit = PressureChanger(default={
                 "property_package": m.fs.properties,
                 "thermodynamic_assumption": ThermodynamicAssumption.pump,
@@ -787,15 +728,13 @@ class Test_costing(object):
 
         assert_units_consistent(m.fs.unit)
 
-        solver.solve(m, tee=True)
+        solver.solve(m)
         assert m.fs.unit.costing.purchase_cost.value == \
             pytest.approx(70115.0, 1e-5)
 
     @pytest.mark.component
-    def test_compressor(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-        m.fs.properties = iapws95.Iapws95ParameterBlock()
+    def test_compressor(self, iapws_base, solver):
+        m = iapws_base.clone()
         m.fs.unit = PressureChanger(default={
                 "property_package": m.fs.properties,
                 "thermodynamic_assumption":
@@ -827,15 +766,13 @@ class Test_costing(object):
 
         assert_units_consistent(m.fs.unit)
 
-        solver.solve(m, tee=True)
+        solver.solve(m)
         assert m.fs.unit.costing.purchase_cost.value == \
             pytest.approx(334598, rel=1e-5)
 
     @pytest.mark.component
-    def test_turbine(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-        m.fs.properties = iapws95.Iapws95ParameterBlock()
+    def test_turbine(self, iapws_base, solver):
+        m = iapws_base.clone()
         m.fs.unit = PressureChanger(default={
                 "property_package": m.fs.properties,
                 "thermodynamic_assumption":
@@ -864,15 +801,13 @@ class Test_costing(object):
 
         assert_units_consistent(m.fs.unit)
 
-        solver.solve(m, tee=True)
+        solver.solve(m)
         assert m.fs.unit.costing.purchase_cost.value ==\
             pytest.approx(213199, 1e-5)
 
     @pytest.mark.component
-    def test_turbine_performance_way1(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-        m.fs.properties = iapws95.Iapws95ParameterBlock()
+    def test_turbine_performance_way1(self, iapws_base, solver):
+        m = iapws_base.clone()
 
         def perf_callback(b):
             unit_hd = units.J/units.kg
@@ -906,17 +841,15 @@ class Test_costing(object):
         m.fs.unit.initialize()
         assert degrees_of_freedom(m) == 0
         assert_units_consistent(m.fs.unit)
-        solver.solve(m, tee=True)
+        solver.solve(m)
 
         assert value(m.fs.unit.efficiency_isentropic[0]) \
             == pytest.approx(0.9, rel=1e-3)
         assert value(m.fs.unit.deltaP[0]) == pytest.approx(-3e5, rel=1e-3)
 
     @pytest.mark.component
-    def test_turbine_performance_way2(self):
-        m = ConcreteModel()
-        m.fs = FlowsheetBlock(default={"dynamic": False})
-        m.fs.properties = iapws95.Iapws95ParameterBlock()
+    def test_turbine_performance_way2(self, iapws_base, solver):
+        m = iapws_base.clone()
         m.fs.unit = Turbine(default={
             "property_package": m.fs.properties,
             "support_isentropic_performance_curves":True})
@@ -946,7 +879,7 @@ class Test_costing(object):
         m.fs.unit.initialize()
         assert degrees_of_freedom(m) == 0
         assert_units_consistent(m.fs.unit)
-        solver.solve(m, tee=True)
+        solver.solve(m)
 
         assert value(m.fs.unit.efficiency_isentropic[0]) \
             == pytest.approx(0.9, rel=1e-3)